@@ -1,25 +1,21 @@
-from django.test import TestCase
-
-# Create your tests here.
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
+from rest_framework.authtoken.models import Token
 from django.contrib.auth import get_user_model
-from posts.models import Post
+from posts.models import Post, Comment
 
 User = get_user_model()
 
 class FollowFeedTests(APITestCase):
-    def setUp(self):
-        self.user1 = User.objects.create_user(username="alice", password="password123")
-        self.user2 = User.objects.create_user(username="bob", password="password123")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="alice", password="password123")
+        cls.user2 = User.objects.create_user(username="bob", password="password123")
+        cls.token = Token.objects.create(user=cls.user1)
 
-        response = self.client.post(reverse("login"), {
-            "username": "alice",
-            "password": "password123"
-        })
-        self.token = response.data["token"]
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token}")
+    def setUp(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
 
     def test_follow_user(self):
         url = reverse("user-follow", kwargs={"pk": self.user2.pk})
@@ -44,8 +40,21 @@ class FollowFeedTests(APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["title"], post.title)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["title"], post.title)
+
+    def test_feed_query_count_does_not_grow_with_posts(self):
+        for i in range(3):
+            post = Post.objects.create(author=self.user2, title=f"Post {i}", content="Content")
+            Comment.objects.create(post=post, author=self.user1, content="Nice")
+        self.user1.following.add(self.user2)
+
+        # token lookup, page count, posts joined with authors, comments joined with authors
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("user-feed"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
 
     def test_feed_empty_if_not_following(self):
         Post.objects.create(author=self.user2, title="Secret", content="Hidden")
@@ -54,7 +63,5 @@ class FollowFeedTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        self.assertEqual(len(response.data), 0)
-
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(response.data["count"], 0)
 
@@ -3,6 +3,7 @@ from .models import Notification
 
 class NotificationSerializer(serializers.ModelSerializer):
     actor_username = serializers.CharField(source='actor.username', read_only=True)
+    target = serializers.StringRelatedField(read_only=True)
 
     class Meta:
         model = Notification
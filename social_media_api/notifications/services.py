@@ -0,0 +1,16 @@
+from django.contrib.contenttypes.models import ContentType
+from .models import Notification
+
+def notify_many(recipient_ids, actor, verb, target):
+    content_type = ContentType.objects.get_for_model(type(target))
+    notifications = [
+        Notification(
+            recipient_id=recipient_id,
+            actor=actor,
+            verb=verb,
+            content_type=content_type,
+            object_id=target.pk,
+        )
+        for recipient_id in recipient_ids
+    ]
+    return Notification.objects.bulk_create(notifications, batch_size=500)
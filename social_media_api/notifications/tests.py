@@ -1,23 +1,26 @@
-from django.test import TestCase
+from unittest import mock
+from django.db import IntegrityError
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from accounts.models import User
 from posts.models import Post, Like
 from notifications.models import Notification
+from notifications.services import notify_many
 # Create your tests here.
 
 
 class LikesNotificationsTests(APITestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create users
-        self.user1 = User.objects.create_user(username='user1', password='pass123')
-        self.user2 = User.objects.create_user(username='user2', password='pass123')
+        cls.user1 = User.objects.create_user(username='user1', password='pass123')
+        cls.user2 = User.objects.create_user(username='user2', password='pass123')
         # Create a post by user2
-        self.post = Post.objects.create(author=self.user2, title='Test Post', content='Content')
+        cls.post = Post.objects.create(author=cls.user2, title='Test Post', content='Content')
 
     def test_like_post_creates_notification(self):
-        self.client.login(username='user1', password='pass123')
+        self.client.force_login(self.user1)
         url = reverse('post-like', args=[self.post.id])
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -27,24 +30,55 @@ class LikesNotificationsTests(APITestCase):
         self.assertTrue(Notification.objects.filter(recipient=self.user2, actor=self.user1).exists())
 
     def test_unlike_post(self):
-        self.client.login(username='user1', password='pass123')
+        self.client.force_login(self.user1)
         Like.objects.create(user=self.user1, post=self.post)
         url = reverse('post-unlike', args=[self.post.id])
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertFalse(Like.objects.filter(user=self.user1, post=self.post).exists())
 
+    def test_unlike_post_not_liked(self):
+        self.client.force_login(self.user1)
+        url = reverse('post-unlike', args=[self.post.id])
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_cannot_like_twice(self):
-        self.client.login(username='user1', password='pass123')
+        self.client.force_login(self.user1)
         Like.objects.create(user=self.user1, post=self.post)
         url = reverse('post-like', args=[self.post.id])
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_like_notification_error_is_not_reported_as_duplicate(self):
+        self.client.force_login(self.user1)
+        url = reverse('post-like', args=[self.post.id])
+        with mock.patch('posts.views.notify_many', side_effect=IntegrityError):
+            with self.assertRaises(IntegrityError):
+                self.client.post(url)
+        self.assertFalse(Like.objects.filter(user=self.user1, post=self.post).exists())
+
+    def test_notify_many_creates_one_notification_per_recipient(self):
+        user3 = User.objects.create_user(username='user3', password='pass123')
+        notify_many([self.user2.id, user3.id], self.user1, 'posted', self.post)
+        self.assertEqual(Notification.objects.filter(actor=self.user1, object_id=self.post.id).count(), 2)
+        self.assertTrue(Notification.objects.filter(recipient=user3, verb='posted').exists())
+
     def test_notifications_endpoint(self):
-        self.client.login(username='user2', password='pass123')
+        self.client.force_login(self.user2)
         Notification.objects.create(recipient=self.user2, actor=self.user1, verb="liked your post", target=self.post)
         url = reverse('notifications-list')
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
\ No newline at end of file
+        self.assertEqual(response.data['count'], 1)
+
+    def test_notifications_endpoint_query_count(self):
+        self.client.force_login(self.user2)
+        for i in range(3):
+            post = Post.objects.create(author=self.user2, title=f'Post {i}', content='Content')
+            Notification.objects.create(recipient=self.user2, actor=self.user1, verb="liked your post", target=post)
+        # session, user, page count, notifications with actors, targets with authors
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('notifications-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
\ No newline at end of file
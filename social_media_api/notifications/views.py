@@ -1,5 +1,6 @@
-from django.shortcuts import render
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 from rest_framework import generics, permissions
+from posts.models import Post
 from .models import Notification
 from .serializers import NotificationSerializer
 # Create your views here.
@@ -9,4 +10,8 @@ class NotificationListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Notification.objects.filter(recipient=self.request.user)
\ No newline at end of file
+        return (
+            Notification.objects.filter(recipient=self.request.user)
+            .select_related('actor')
+            .prefetch_related(GenericPrefetch('target', [Post.objects.select_related('author')]))
+        )
\ No newline at end of file
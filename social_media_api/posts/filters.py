@@ -0,0 +1,10 @@
+import django_filters
+from .models import Post
+
+class PostFilter(django_filters.FilterSet):
+    # Substring match, served by the trigram index on UPPER(content).
+    content = django_filters.CharFilter(lookup_expr='icontains')
+
+    class Meta:
+        model = Post
+        fields = ['title', 'content']
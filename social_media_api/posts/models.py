@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from accounts.models import CustomUser
 
 class Post(models.Model):
@@ -12,6 +14,10 @@ class Post(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['author', '-created_at']),
+            GinIndex(OpClass(Upper('content'), name='gin_trgm_ops'), name='posts_post_content_trgm_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} by {self.author.username}"
@@ -22,8 +28,10 @@ class Like(models.Model):
     timestamp = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        unique_together = ('user', 'post')
         ordering = ['-timestamp']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'post'], name='unique_like_per_user'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} liked {self.post.title}"
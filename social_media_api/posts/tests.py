@@ -1,3 +1,46 @@
-from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from accounts.models import User
+from posts.models import Post, Comment
 
-# Create your tests here.
+
+class PostListTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username='user1', password='pass123')
+        cls.user2 = User.objects.create_user(username='user2', password='pass123')
+        for i in range(3):
+            post = Post.objects.create(author=cls.user1, title=f'Post {i}', content='Content')
+            Comment.objects.create(post=post, author=cls.user2, content='Nice')
+
+    def test_list_query_count_does_not_grow_with_posts(self):
+        # page count, posts joined with authors, comments joined with authors
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('post-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(response.data['results'][0]['author'], 'user1')
+        self.assertEqual(response.data['results'][0]['comments'][0]['author'], 'user2')
+
+
+class PostFilterTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='user1', password='pass123')
+        cls.post = Post.objects.create(author=cls.user, title='Hello World', content='Learning Django REST Framework')
+        Post.objects.create(author=cls.user, title='Hello', content='Something else')
+
+    def test_content_filter_matches_substring_case_insensitively(self):
+        response = self.client.get(reverse('post-list'), {'content': 'django rest'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['results'][0]['id'], self.post.id)
+
+    def test_title_filter_matches_exactly(self):
+        response = self.client.get(reverse('post-list'), {'title': 'Hello'})
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['results'][0]['title'], 'Hello')
+
+        response = self.client.get(reverse('post-list'), {'title': 'hello'})
+        self.assertEqual(response.data['count'], 0)
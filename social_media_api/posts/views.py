@@ -1,59 +1,79 @@
 from rest_framework import viewsets, permissions, status, generics
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.views import APIView
 
-from accounts.models import CustomUser
-from notifications.models import Notification
+from notifications.services import notify_many
+from .filters import PostFilter
 from .models import Post, Comment, Like
 from .serializers import PostSerializer, CommentSerializer
 
+def _comments_prefetch():
+    # Only load the columns CommentSerializer renders, not the full author row.
+    return Prefetch(
+        'comments',
+        queryset=Comment.objects.select_related('author').only(
+            'id', 'post', 'author__username', 'content', 'created_at', 'updated_at'
+        ),
+    )
+
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def like_post(request, pk):
     post = generics.get_object_or_404(Post, pk=pk)
-    like, created = Like.objects.get_or_create(user=request.user, post=post)
+    with transaction.atomic():
+        try:
+            # Savepoint so only a duplicate like is reported as "already liked".
+            with transaction.atomic():
+                Like.objects.create(user=request.user, post=post)
+        except IntegrityError:
+            return Response({'detail': 'You have already liked this post.'}, status=status.HTTP_400_BAD_REQUEST)
 
-    if created and post.author != request.user:
-        Notification.objects.create(
-            recipient=post.author,
-            actor=request.user,
-            verb='liked your post',
-            content_type=ContentType.objects.get_for_model(post),
-            object_id=post.id
-        )
+        if post.author_id != request.user.id:
+            notify_many([post.author_id], request.user, 'liked your post', post)
 
     return Response({'status': 'post liked'}, status=status.HTTP_200_OK)
 
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def unlike_post(request, pk):
-    post = generics.get_object_or_404(Post, pk=pk)
-    Like.objects.filter(user=request.user, post=post).delete()
+    deleted, _ = Like.objects.filter(user=request.user, post_id=pk).delete()
+    if not deleted:
+        return Response({'detail': 'You have not liked this post.'}, status=status.HTTP_404_NOT_FOUND)
     return Response({'status': 'post unliked'}, status=status.HTTP_200_OK)
 
-class FeedView(APIView):
+class FeedView(generics.ListAPIView):
+    serializer_class = PostSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-    def get(self, request):
-        user = request.user
-        following_users = user.following.all()
-        posts = Post.objects.filter(author__in=following_users).order_by('-created_at')
-        serializer = PostSerializer(posts, many=True, context={'request': request})
-        return Response(serializer.data)
+    def get_queryset(self):
+        following_users = self.request.user.following.all()
+        return (
+            Post.objects.filter(author__in=following_users)
+            .select_related('author')
+            .prefetch_related(_comments_prefetch())
+            .order_by('-created_at')
+        )
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         return request.method in permissions.SAFE_METHODS or obj.author == request.user
 
 class PostViewSet(viewsets.ModelViewSet):
-    queryset = Post.objects.all()
+    queryset = Post.objects.select_related('author').prefetch_related(_comments_prefetch())
     serializer_class = PostSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['title', 'content']
+    filterset_class = PostFilter
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Only load the columns PostSerializer renders.
+            queryset = queryset.only('id', 'author__username', 'title', 'content', 'created_at', 'updated_at')
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)